@@ -0,0 +1,266 @@
+import asyncio
+import atexit
+import json
+import threading
+from typing import Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+
+from osrs_scraper.api.wiki_api import BASE_URL, MonsterPage, extract_monster_page, extract_wikitext_drops, has_table_with_class
+from osrs_scraper.utils.logging import log_api_response, log_parsed_data
+
+T = TypeVar("T")
+
+DEFAULT_MAX_IN_FLIGHT = 200
+USER_AGENT = "OSRS-Drop-Parser (https://github.com/gillesdm/OSRS-Drop-Parser)"
+
+class WikiRequestError(Exception):
+    """
+    A wiki API request failed (non-200 status, timeout or connection error), as opposed to the wiki answering
+    with an error or an empty page.
+    """
+
+class AsyncWikiClient:
+    """
+    Asyncio client for the OSRS Wiki API.
+    All requests share one aiohttp connection pool, and at most `max_in_flight` of them run at once,
+    so thousands of lookups can be scheduled with asyncio.gather without opening thousands of sockets.
+    Decoding and parsing a page runs in a worker thread (asyncio.to_thread), so a long parse does not
+    stall the network I/O of the other requests in flight.
+
+        async with AsyncWikiClient() as client:
+            pages = await asyncio.gather(*(client.get_monster_drops(name) for name in monsters))
+    """
+
+    def __init__(self, base_url: str = BASE_URL, max_in_flight: int = DEFAULT_MAX_IN_FLIGHT, timeout: float = 30):
+        self.base_url = base_url
+        self.max_in_flight = max_in_flight
+        self.timeout = timeout
+        self._session = None
+        self._semaphore = asyncio.Semaphore(max_in_flight)
+
+    async def __aenter__(self) -> "AsyncWikiClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _get_session(self):
+        if self._session is None:
+            import aiohttp
+
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_in_flight),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={"User-Agent": USER_AGENT},
+            )
+        return self._session
+
+    async def _get(self, label: str, params: Dict[str, str]) -> Tuple[int, bytes]:
+        """
+        Perform one API request and return (status, raw body). The body is decoded by the caller, once.
+        Timeouts and connection errors are raised as WikiRequestError.
+        """
+        import aiohttp
+
+        async with self._semaphore:
+            try:
+                async with self._get_session().get(self.base_url, params=params) as response:
+                    body = await response.read()
+                    log_api_response(label, self.base_url, params, response.status, response.headers, body)
+                    return response.status, body
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                raise WikiRequestError(f"{str(e) or type(e).__name__} for {label}") from e
+
+    async def get_category_members(self, category_name: str) -> list[str]:
+        """Fetch all items in a given category from the OSRS Wiki."""
+        params = {
+            "action": "query",
+            "list": "categorymembers",
+            "cmtitle": f"Category:{category_name}",
+            "cmlimit": "500",
+            "format": "json"
+        }
+
+        items = []
+
+        while True:
+            status, body = await self._get(category_name, params)
+            if status != 200:
+                raise WikiRequestError(f"HTTP {status} for Category:{category_name}")
+            data = json.loads(body)
+
+            items.extend(member["title"] for member in data["query"]["categorymembers"])
+
+            if "continue" not in data:
+                break
+            params = {**params, "cmcontinue": data["continue"]["cmcontinue"]}
+
+        log_parsed_data(category_name, "category_members", items)
+        return items
+
+    async def get_monster_drops(self, monster_name: str) -> MonsterPage:
+        """Fetch all drop tables for a given monster, following redirects."""
+        try:
+            return await self.fetch_monster_page(monster_name)
+        except WikiRequestError as e:
+            print(f"Failed to fetch data for {monster_name}: {e}")
+            return MonsterPage(monster_name, None, ())
+
+    async def fetch_monster_page(self, monster_name: str) -> MonsterPage:
+        """
+        Like get_monster_drops, but raise WikiRequestError when the request itself fails (non-200 status)
+        instead of returning an empty page, so callers can tell a failed fetch from a page without drops.
+        """
+        params = {
+            "action": "parse",
+            "page": monster_name,
+            "format": "json",
+            "prop": "text|revid",
+            "contentmodel": "wikitext",
+            "redirects": "1"
+        }
+
+        status, body = await self._get(monster_name, params)
+
+        if status != 200:
+            raise WikiRequestError(f"HTTP {status} for {monster_name}")
+
+        data = await asyncio.to_thread(json.loads, body)
+        del body
+        page = await asyncio.to_thread(extract_monster_page, monster_name, data)
+
+        # Only pages without rendered drop tables need their wikitext, so it is fetched separately, for the same revision
+        if not page.items and page.revid is not None:
+            page = MonsterPage(page.title, page.revid, tuple(sorted(await self._fetch_wikitext_drops(page))))
+
+        if page.redirected_name(monster_name):
+            print(f"Redirecting to: {page.title}")
+        log_parsed_data(monster_name, "monster_drops", list(page.items))
+        return page
+
+    async def _fetch_wikitext_drops(self, page: MonsterPage) -> list[str]:
+        params = {
+            "action": "parse",
+            "oldid": str(page.revid),
+            "format": "json",
+            "prop": "wikitext"
+        }
+
+        status, body = await self._get(page.title, params)
+
+        if status != 200:
+            raise WikiRequestError(f"HTTP {status} for the wikitext of {page.title}")
+
+        data = await asyncio.to_thread(json.loads, body)
+        del body
+        return await asyncio.to_thread(extract_wikitext_drops, data)
+
+    async def get_recent_changes(self, since: str, namespaces: str = "0|14") -> set[str]:
+        """
+        Return the titles of pages edited, created, moved or recategorized since an ISO 8601 timestamp.
+        The wiki only keeps recent changes for about 30 days.
+        """
+        params = {
+            "action": "query",
+            "list": "recentchanges",
+            "rcstart": since,
+            "rcdir": "newer",
+            "rcnamespace": namespaces,
+            "rctype": "edit|new|log|categorize",
+            "rcprop": "title",
+            "rclimit": "500",
+            "format": "json"
+        }
+
+        titles = set()
+
+        while True:
+            status, body = await self._get("recentchanges", params)
+            if status != 200:
+                raise WikiRequestError(f"HTTP {status} for recent changes")
+            data = json.loads(body)
+
+            titles.update(change["title"] for change in data["query"]["recentchanges"])
+
+            if "continue" not in data:
+                break
+            params = {**params, "rccontinue": data["continue"]["rccontinue"]}
+
+        log_parsed_data("recentchanges", "changed_titles", sorted(titles))
+        return titles
+
+    async def is_monster(self, entry: str) -> Optional[bool]:
+        """
+        Check if a given entry is a monster by looking for the "infobox-monster" table.
+        Returns None when the check itself failed (network error or non-200 status), so callers can tell
+        "not a monster" apart from "unknown" and retry the latter.
+        """
+        params = {
+            "action": "parse",
+            "page": entry,
+            "format": "json",
+            "prop": "text"
+        }
+
+        try:
+            status, body = await self._get(entry, params)
+
+            if status != 200:
+                print(f"Failed to check entry '{entry}': HTTP {status}")
+                return None
+
+            data = await asyncio.to_thread(json.loads, body)
+            del body
+
+            if 'error' in data or 'parse' not in data or 'text' not in data['parse']:
+                return False
+
+            html_content = data.pop('parse')['text']['*']
+            return await asyncio.to_thread(has_table_with_class, html_content, 'infobox-monster')
+        except Exception as e:
+            print(f"Error processing entry '{entry}': {str(e) or type(e).__name__}")
+            return None
+
+# One background event loop and client shared by every synchronous caller in the process.
+_shared_loop: Optional[asyncio.AbstractEventLoop] = None
+_shared_client: Optional[AsyncWikiClient] = None
+_shared_lock = threading.Lock()
+_shared_base_url = BASE_URL
+
+def set_shared_base_url(base_url: str) -> None:
+    """Point the shared client at another API endpoint (e.g. a local stand-in server). Must be called before the first request."""
+    global _shared_base_url
+    _shared_base_url = base_url
+
+def _start_shared_loop() -> Tuple[asyncio.AbstractEventLoop, AsyncWikiClient]:
+    global _shared_loop, _shared_client
+    with _shared_lock:
+        if _shared_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="wiki-api-loop", daemon=True).start()
+            _shared_client = asyncio.run_coroutine_threadsafe(_create_client(), loop).result()
+            _shared_loop = loop
+            atexit.register(_stop_shared_loop)
+    return _shared_loop, _shared_client
+
+async def _create_client() -> AsyncWikiClient:
+    # The client (and its semaphore) must be created on the loop that will run its requests
+    return AsyncWikiClient(_shared_base_url)
+
+def _stop_shared_loop() -> None:
+    global _shared_loop, _shared_client
+    if _shared_loop is None:
+        return
+    asyncio.run_coroutine_threadsafe(_shared_client.close(), _shared_loop).result(timeout=5)
+    _shared_loop.call_soon_threadsafe(_shared_loop.stop)
+    _shared_loop = None
+    _shared_client = None
+
+def run_sync(request: Callable[[AsyncWikiClient], Awaitable[T]]) -> T:
+    """Run a request on the shared client from synchronous code and wait for its result."""
+    loop, client = _start_shared_loop()
+    return asyncio.run_coroutine_threadsafe(request(client), loop).result()
@@ -1,92 +1,149 @@
-import requests
-import re
-from bs4 import BeautifulSoup
-import mwparserfromhell
-from osrs_scraper.utils.logging import log_api_response, log_parsed_data
+from html.parser import HTMLParser
+from typing import Any, Dict, List, Optional, Tuple
 
 BASE_URL = "https://oldschool.runescape.wiki/api.php"
 
+class MonsterPage:
+    """The drops parsed from a monster page. Holds no part of the raw API response."""
+
+    __slots__ = ("title", "revid", "items")
+
+    def __init__(self, title: str, revid: Optional[int], items: Tuple[str, ...]):
+        self.title = title  # Canonical title, after following redirects
+        self.revid = revid
+        self.items = items
+
+    def redirected_name(self, requested_name: str) -> Optional[str]:
+        """The canonical title if the requested name redirected (or was normalized) to another page."""
+        return self.title if self.title != requested_name else None
+
+    def __repr__(self) -> str:
+        return f"MonsterPage({self.title!r}, revid={self.revid}, {len(self.items)} items)"
+
+# The synchronous functions below are thin wrappers around the shared AsyncWikiClient
+# (see async_wiki_api.py), so every caller goes through one event loop and connection pool.
+
 def get_category_members(category_name: str) -> list[str]:
     """Fetch all items in a given category from the OSRS Wiki."""
-    params = {
-        "action": "query",
-        "list": "categorymembers",
-        "cmtitle": f"Category:{category_name}",
-        "cmlimit": "500",
-        "format": "json"
-    }
-    
-    items = []
-    
-    while True:
-        response = requests.get(BASE_URL, params=params)
-        log_api_response(category_name, BASE_URL, params, response)
-        data = response.json()
-        
-        items.extend(member["title"] for member in data["query"]["categorymembers"])
-        
-        if "continue" not in data:
-            break
-        params["cmcontinue"] = data["continue"]["cmcontinue"]
-    
-    log_parsed_data(category_name, "category_members", items)
-    return items
-
-def get_monster_drops(monster_name: str) -> list[str]:
+    from osrs_scraper.api.async_wiki_api import run_sync
+    return run_sync(lambda client: client.get_category_members(category_name))
+
+def get_monster_drops(monster_name: str) -> MonsterPage:
     """Fetch all drop tables for a given monster from the OSRS Wiki using the API."""
-    params = {
-        "action": "parse",
-        "page": monster_name,
-        "format": "json",
-        "prop": "text|wikitext",
-        "contentmodel": "wikitext"
-    }
-    
-    response = requests.get(BASE_URL, params=params)
-    log_api_response(monster_name, BASE_URL, params, response)
-    
-    if response.status_code != 200:
-        print(f"Failed to fetch data for {monster_name}")
-        return []
-    
-    data = response.json()
-    
-    if 'error' in data:
-        print(f"Error fetching data for {monster_name}: {data['error']['info']}")
-        # Check for redirect
-        redirect_match = re.search(r'<ul class="redirectText">.*?<a href="/w/(.*?)"', response.text)
-        if redirect_match:
-            redirect_page = redirect_match.group(1).replace('_', ' ').replace('%27', "'")
-            print(f"Redirecting to: {redirect_page}")
-            return get_monster_drops(redirect_page)
-        return [], None
-    
-    # Check for redirect in successful responses as well
-    redirect_match = re.search(r'<div class="redirectMsg">.*?<a href="/w/(.*?)"', data['parse']['text']['*'])
-    if redirect_match:
-        redirect_page = redirect_match.group(1).replace('_', ' ').replace('%27', "'")
-        print(f"Redirecting to: {redirect_page}")
-        return get_monster_drops(redirect_page), redirect_page
-    
-    html_content = data['parse']['text']['*']
-    wikitext_content = data['parse']['wikitext']['*']
-    
-    drops = parse_drops(html_content) or parse_wikitext_drops(wikitext_content)
-    
-    log_parsed_data(monster_name, "monster_drops", drops)
-    return drops, None
+    from osrs_scraper.api.async_wiki_api import run_sync
+    return run_sync(lambda client: client.get_monster_drops(monster_name))
+
+def extract_monster_page(monster_name: str, data: Dict[str, Any]) -> MonsterPage:
+    """
+    Turn a decoded action=parse response into a MonsterPage.
+    The rendered HTML (and wikitext, when the response has it) is popped out of `data` and released as soon as
+    it is parsed, so the caller's reference to the response does not keep it alive.
+    """
+    if 'error' in data or 'parse' not in data:
+        if 'error' in data:
+            print(f"Error fetching data for {monster_name}: {data['error']['info']}")
+        data.clear()
+        return MonsterPage(monster_name, None, ())
+
+    parsed = data.pop('parse')
+    data.clear()
+    title = parsed.get('title', monster_name)
+    revid = parsed.get('revid')
+
+    drops = parse_drops(parsed.pop('text', {}).pop('*', ''))
+    if not drops and 'wikitext' in parsed:
+        drops = extract_wikitext_drops({'parse': parsed})
+    del parsed
+
+    return MonsterPage(title, revid, tuple(sorted(drops)))
+
+def extract_wikitext_drops(data: Dict[str, Any]) -> list[str]:
+    """Parse the drops out of a decoded prop=wikitext response, releasing the wikitext once it is parsed."""
+    wikitext = data.pop('parse', {}).pop('wikitext', {}).pop('*', '')
+    data.clear()
+    return parse_wikitext_drops(wikitext) if wikitext else []
+
+def _has_class(attrs: List[Tuple[str, Optional[str]]], class_name: str) -> bool:
+    return any(name == 'class' and value and class_name in value.split() for name, value in attrs)
+
+class _DropTableParser(HTMLParser):
+    """
+    Streams through rendered HTML and collects the text of the second cell of every row after the
+    header row in tables with the "item-drops" class. Unlike a parse tree, nothing but the drop
+    names outlives the call, and the page is never held in memory twice.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.drops: List[str] = []
+        self._table_depth = 0  # Nesting depth inside an item-drops table, 0 when outside one
+        self._row = -1
+        self._cell = -1
+        self._text: Optional[List[str]] = None
+
+    def _finish_cell(self) -> None:
+        if self._text is not None:
+            self.drops.append(''.join(self._text).strip())
+            self._text = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'table':
+            if self._table_depth:
+                self._table_depth += 1
+            elif _has_class(attrs, 'item-drops'):
+                self._table_depth = 1
+                self._row = -1
+        elif self._table_depth == 1:
+            if tag == 'tr':
+                self._finish_cell()
+                self._row += 1
+                self._cell = -1
+            elif tag == 'td':
+                self._finish_cell()
+                self._cell += 1
+                if self._row >= 1 and self._cell == 1:
+                    self._text = []
+
+    def handle_endtag(self, tag):
+        if tag == 'table' and self._table_depth:
+            self._table_depth -= 1
+            if not self._table_depth:
+                self._finish_cell()
+        elif tag in ('td', 'tr') and self._table_depth == 1:
+            self._finish_cell()
+
+    def handle_data(self, data):
+        if self._text is not None:
+            self._text.append(data)
+
+class _TableClassFinder(HTMLParser):
+    """Checks whether rendered HTML contains a table with a given class."""
+
+    def __init__(self, class_name: str):
+        super().__init__(convert_charrefs=False)
+        self.class_name = class_name
+        self.found = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'table' and not self.found and _has_class(attrs, self.class_name):
+            self.found = True
+
+def has_table_with_class(content: str, class_name: str) -> bool:
+    finder = _TableClassFinder(class_name)
+    finder.feed(content)
+    finder.close()
+    return finder.found
 
 def parse_drops(content: str) -> list[str]:
-    soup = BeautifulSoup(content, 'html.parser')
-    drops = [
-        cells[1].text.strip()
-        for drops_table in soup.find_all('table', class_='item-drops')
-        for row in drops_table.find_all('tr')[1:]
-        if (cells := row.find_all('td')) and len(cells) >= 2
-    ]
-    return list(set(drops))  # Remove duplicates
+    parser = _DropTableParser()
+    parser.feed(content)
+    parser.close()
+    parser._finish_cell()
+    return list(set(parser.drops))  # Remove duplicates
 
 def parse_wikitext_drops(content: str) -> list[str]:
+    import mwparserfromhell
+
     wikicode = mwparserfromhell.parse(content)
     drops = [
         drop
@@ -97,6 +154,8 @@ def parse_wikitext_drops(content: str) -> list[str]:
     return list(set(drops))  # Remove duplicates
 
 def parse_drop_template(template):
+    import mwparserfromhell
+
     drops = []
     for param in template.params:
         param_name = param.name.strip().lower()
@@ -111,31 +170,7 @@ def parse_drop_template(template):
                 drops.extend(parse_drop_template(nested_template[0]))
     return drops
 
-def is_monster(entry: str) -> bool:
-    """Check if a given entry is a monster by looking for the "infobox-monster" table."""
-    params = {
-        "action": "parse",
-        "page": entry,
-        "format": "json",
-        "prop": "text"
-    }
-    
-    try:
-        response = requests.get(BASE_URL, params=params)
-        log_api_response(entry, BASE_URL, params, response)
-        
-        if response.status_code != 200:
-            return False
-        
-        data = response.json()
-        
-        if 'error' in data or 'parse' not in data or 'text' not in data['parse']:
-            return False
-        
-        html_content = data['parse']['text']['*']
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
-        return bool(soup.find('table', class_='infobox-monster'))
-    except Exception as e:
-        print(f"Error processing entry '{entry}': {str(e)}")
-        return False
+def is_monster(entry: str) -> Optional[bool]:
+    """Check if a given entry is a monster by looking for the "infobox-monster" table. None means the check failed."""
+    from osrs_scraper.api.async_wiki_api import run_sync
+    return run_sync(lambda client: client.is_monster(entry))
@@ -1,6 +1,10 @@
 import json
 import os
-from typing import Dict, Optional
+import re
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from osrs_scraper.utils.lru_cache import LRUCache
 
 def load_item_database(file_path: str = 'assets/item-db.json') -> Dict[str, Dict]:
     try:
@@ -13,11 +17,15 @@ def load_item_database(file_path: str = 'assets/item-db.json') -> Dict[str, Dict
         print("You may need to download or create the item database file.")
         return {}
 
-def get_item_id(item_name: str, item_db: Dict[str, Dict]) -> Optional[int]:
+def get_item_id(item_name: str, item_db: Dict[str, Dict], item_index: Optional["ItemIndex"] = None) -> Optional[int]:
     """
     Look up the item ID for a given item name.
     If not found, try searching without suffixes like '(m)'.
+    When an item index is given, lookups use its name table and fall back to fuzzy matching.
     """
+    if item_index is not None:
+        return item_index.get_item_id(item_name)
+
     item_name_lower = item_name.lower()
     for item_id, item_data in item_db.items():
         if item_data['name'].lower() == item_name_lower:
@@ -32,3 +40,145 @@ def get_item_id(item_name: str, item_db: Dict[str, Dict]) -> Optional[int]:
     
     return None
 
+_NON_ALNUM = re.compile(r'[^a-z0-9]+')
+_NOTED_SUFFIX = re.compile(r'\s*\(noted\)\s*$')
+_WORD_SUFFIX = re.compile(r'\s*\([^()0-9]*\)\s*$')
+
+def normalize_item_name(name: str) -> str:
+    """Lowercase a name and collapse punctuation (brackets, apostrophes, dashes) into single spaces."""
+    return _NON_ALNUM.sub(' ', name.lower()).strip()
+
+def name_trigrams(normalized_name: str) -> frozenset:
+    padded = f"  {normalized_name} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+def _singular(token: str) -> str:
+    return token[:-1] if len(token) > 3 and token.endswith('s') and not token.endswith('ss') else token
+
+def variant_tokens(name: str) -> Tuple[str, ...]:
+    """
+    The tokens of a name with variant noise removed: "(noted)", punctuation, spacing and plural "s".
+    Dose and charge numbers are kept, so "Prayer potion(1)" and "Prayer potion(4)" stay different.
+    """
+    name = _NOTED_SUFFIX.sub('', name.lower())
+    return tuple(_singular(token) for token in normalize_item_name(name).split())
+
+def _edit_distance_at_most_one(a: str, b: str) -> bool:
+    """True if a and b differ by at most one insertion, deletion, substitution or adjacent transposition."""
+    if abs(len(a) - len(b)) > 1:
+        return False
+    if len(a) > len(b):
+        a, b = b, a
+    i = 0
+    while i < len(a) and a[i] == b[i]:
+        i += 1
+    if len(a) < len(b):
+        return a[i:] == b[i + 1:]
+    transposed = a[i:i + 2] == b[i + 1:i + 2] + b[i:i + 1] and a[i + 2:] == b[i + 2:]
+    return a[i + 1:] == b[i + 1:] or transposed
+
+def is_typo_of(query: Tuple[str, ...], candidate: Tuple[str, ...], min_token_length: int = 5) -> bool:
+    """
+    Accept a fuzzy candidate only if it reads as a misspelling of the query: the same number tokens, the same
+    number of words, and at most one word off by a single edit (words of at least `min_token_length` letters).
+    "Dragon bolts" vs "Dragon bones" or "Onyx bolts" vs "Onyx bolt tips" are different items, not typos.
+    """
+    if len(query) != len(candidate):
+        return False
+    if [token for token in query if token.isdigit()] != [token for token in candidate if token.isdigit()]:
+        return False
+    differing = [(q, c) for q, c in zip(query, candidate) if q != c]
+    if len(differing) != 1:
+        return False  # Identical tokens are a variant match, not a typo, and must be resolved by the variant table
+    q, c = differing[0]
+    return min(len(q), len(c)) >= min_token_length and not q.isdigit() and _edit_distance_at_most_one(q, c)
+
+class ItemIndex:
+    """
+    Exact-name and variant-name tables plus a trigram index over the item database.
+    A name resolves by exact match first, then by its variant tokens (see variant_tokens), and only then by a
+    fuzzy match. The trigram index only finds fuzzy candidates; a candidate is accepted when it scores above
+    the threshold and passes is_typo_of, so near-misses that are different items stay unresolved.
+    Fuzzy lookups only scan the postings of the rarest trigrams of a name, so each
+    lookup touches at most `max_probes` postings and `max_postings` entries regardless of the database size.
+    """
+
+    def __init__(self, item_db: Dict[str, Dict], threshold: float = 0.75, max_postings: int = 1000, max_probes: int = 6, cache_size: int = 16384):
+        self.threshold = threshold
+        self.max_postings = max_postings
+        self.max_probes = max_probes
+        self.exact: Dict[str, int] = {}
+        self.variants: Dict[str, Optional[int]] = {}  # None marks a variant key shared by different items
+        self.ids: List[int] = []
+        self.tokens: List[Tuple[str, ...]] = []
+        self.trigrams: List[frozenset] = []
+        self.postings: Dict[str, List[int]] = {}
+        self._fuzzy_cache = LRUCache(cache_size)
+
+        for item_id, item_data in item_db.items():
+            name = item_data['name']
+            self.exact.setdefault(name.lower(), int(item_id))
+            tokens = variant_tokens(name)
+            if not tokens:
+                continue
+            # Items that share a name share an ID in the exact table, so only different names can clash
+            key = ''.join(tokens)
+            variant_id = self.exact[name.lower()]
+            if self.variants.setdefault(key, variant_id) != variant_id:
+                self.variants[key] = None
+            grams = name_trigrams(' '.join(tokens))
+            position = len(self.ids)
+            self.ids.append(int(item_id))
+            self.tokens.append(tokens)
+            self.trigrams.append(grams)
+            for gram in grams:
+                self.postings.setdefault(gram, []).append(position)
+
+    def get_item_id(self, item_name: str) -> Optional[int]:
+        item_name_lower = item_name.lower()
+        if item_name_lower in self.exact:
+            return self.exact[item_name_lower]
+        # Suffixes without numbers, like "(m)" or "(uncharged)"; doses and charges are never dropped
+        base_name = _WORD_SUFFIX.sub('', item_name_lower)
+        if base_name != item_name_lower and base_name in self.exact:
+            return self.exact[base_name]
+        item_id = self.variants.get(''.join(variant_tokens(item_name)))
+        if item_id is not None:
+            return item_id
+        match = self.fuzzy_match(item_name)
+        return match[0] if match else None
+
+    def fuzzy_match(self, item_name: str) -> Optional[Tuple[int, float]]:
+        """Return the best (item_id, score) for a misspelled name, or None if no candidate is accepted."""
+        return self._fuzzy_cache.get_or_compute(item_name, lambda: self._fuzzy_match(item_name))
+
+    def _fuzzy_match(self, item_name: str) -> Optional[Tuple[int, float]]:
+        tokens = variant_tokens(item_name)
+        if not tokens:
+            return None
+        query = name_trigrams(' '.join(tokens))
+
+        # Count shared trigrams over the rarest few postings only, within a fixed budget.
+        # A close match shares most trigrams with the query, so it shows up among the rare ones.
+        overlap = Counter()
+        budget = self.max_postings
+        rarest = sorted((self.postings[gram] for gram in query if gram in self.postings), key=len)
+        for posting in rarest[:self.max_probes]:
+            if len(posting) > budget and overlap:
+                break
+            overlap.update(posting[:budget])
+            budget -= len(posting)
+            if budget <= 0:
+                break
+
+        best = None
+        for position, _ in overlap.most_common(16):
+            candidate = self.trigrams[position]
+            score = 2 * len(query & candidate) / (len(query) + len(candidate))
+            if score < self.threshold or not is_typo_of(tokens, self.tokens[position]):
+                continue
+            if self.variants.get(''.join(self.tokens[position])) is None:
+                continue  # Several items share this variant key, so a misspelling of it cannot be told apart
+            if best is None or score > best[1] or (score == best[1] and self.ids[position] < best[0]):
+                best = (self.ids[position], score)
+        return best
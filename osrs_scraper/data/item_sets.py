@@ -0,0 +1,202 @@
+import base64
+import json
+import os
+import zlib
+from typing import Dict, Iterable, Iterator, List
+
+DEFAULT_STORE_PATH = os.path.join("Droplists", "item_sets.json")
+
+class ItemIdSet:
+    """A set of item IDs stored as a bitset, where bit N is set when item ID N is present."""
+
+    __slots__ = ("bits",)
+
+    def __init__(self, bits: int = 0):
+        self.bits = bits
+
+    @classmethod
+    def from_ids(cls, item_ids: Iterable[int]) -> "ItemIdSet":
+        bits = 0
+        for item_id in item_ids:
+            if item_id < 0:
+                raise ValueError(f"Item IDs must be non-negative, got {item_id}")
+            bits |= 1 << item_id
+        return cls(bits)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "ItemIdSet":
+        return cls(int.from_bytes(zlib.decompress(data), "little"))
+
+    def to_bytes(self) -> bytes:
+        return zlib.compress(self.bits.to_bytes((self.bits.bit_length() + 7) // 8, "little"))
+
+    def __or__(self, other: "ItemIdSet") -> "ItemIdSet":
+        return ItemIdSet(self.bits | other.bits)
+
+    def __and__(self, other: "ItemIdSet") -> "ItemIdSet":
+        return ItemIdSet(self.bits & other.bits)
+
+    def __sub__(self, other: "ItemIdSet") -> "ItemIdSet":
+        return ItemIdSet(self.bits & ~other.bits)
+
+    def __xor__(self, other: "ItemIdSet") -> "ItemIdSet":
+        return ItemIdSet(self.bits ^ other.bits)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, ItemIdSet) and self.bits == other.bits
+
+    def __contains__(self, item_id: int) -> bool:
+        return item_id >= 0 and bool(self.bits >> item_id & 1)
+
+    def __len__(self) -> int:
+        return bin(self.bits).count("1")
+
+    def __iter__(self) -> Iterator[int]:
+        """Yield item IDs in ascending order."""
+        bits = self.bits
+        while bits:
+            low_bit = bits & -bits
+            yield low_bit.bit_length() - 1
+            bits ^= low_bit
+
+    def __repr__(self) -> str:
+        return f"ItemIdSet({len(self)} items)"
+
+class ItemSetStore:
+    """Per-monster and per-category item ID sets, persisted between runs."""
+
+    def __init__(self, path: str = DEFAULT_STORE_PATH):
+        self.path = path
+        self.monsters: Dict[str, ItemIdSet] = {}
+        self.categories: Dict[str, ItemIdSet] = {}
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_STORE_PATH) -> "ItemSetStore":
+        store = cls(path)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return store
+        for section in ("monsters", "categories"):
+            getattr(store, section).update(
+                (name, ItemIdSet.from_bytes(base64.b64decode(encoded)))
+                for name, encoded in data.get(section, {}).items()
+            )
+        return store
+
+    def save(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        data = {
+            section: {
+                name: base64.b64encode(id_set.to_bytes()).decode('ascii')
+                for name, id_set in getattr(self, section).items()
+            }
+            for section in ("monsters", "categories")
+        }
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+    def set_monster(self, monster_name: str, item_ids: Iterable[int]) -> None:
+        self.monsters[monster_name] = ItemIdSet.from_ids(item_ids)
+
+    def set_category(self, category: str, item_ids: Iterable[int]) -> None:
+        self.categories[category] = ItemIdSet.from_ids(item_ids)
+
+    def lookup(self, name: str) -> ItemIdSet:
+        """Find a saved set by name, preferring categories over monsters. Names are case-insensitive."""
+        for prefix, section in (("category:", self.categories), ("monster:", self.monsters)):
+            if name.lower().startswith(prefix):
+                return self._find(name[len(prefix):].strip(), section, prefix.rstrip(':'))
+        try:
+            return self._find(name, self.categories, "category")
+        except KeyError:
+            return self._find(name, self.monsters, "monster")
+
+    @staticmethod
+    def _find(name: str, section: Dict[str, ItemIdSet], kind: str) -> ItemIdSet:
+        if name in section:
+            return section[name]
+        for saved_name, id_set in section.items():
+            if saved_name.lower() == name.lower():
+                return id_set
+        raise KeyError(f"No saved {kind} set named '{name}'")
+
+_OPERATORS = "|&-^()"
+
+def _tokenize(expression: str) -> List[tuple]:
+    """Split an expression into ("op", char) and ("name", str) tokens. A '-' inside a bare name is kept unless preceded by whitespace."""
+    tokens = []
+    position = 0
+    while position < len(expression):
+        char = expression[position]
+        if char.isspace():
+            position += 1
+        elif char in _OPERATORS:
+            tokens.append(("op", char))
+            position += 1
+        elif char == '"':
+            closing = expression.find('"', position + 1)
+            if closing == -1:
+                raise ValueError(f"Unterminated quote at position {position}")
+            tokens.append(("name", expression[position + 1:closing]))
+            position = closing + 1
+        else:
+            start = position
+            while position < len(expression):
+                char = expression[position]
+                if char in '|&^()"' or (char == '-' and expression[position - 1].isspace()):
+                    break
+                position += 1
+            tokens.append(("name", expression[start:position].strip()))
+    return tokens
+
+def evaluate_set_expression(expression: str, store: ItemSetStore) -> ItemIdSet:
+    """
+    Evaluate a set expression over saved sets.
+    Supports | (union), & (intersection), - (difference), ^ (symmetric difference) and parentheses,
+    e.g. '"Zulrah" - "Vorkath"' or '(Slayer bosses | Demons) & monster:Abyssal demon'.
+    Operators are evaluated left to right; names containing |, &, ^, parentheses or ' - ' must be double-quoted.
+    """
+    tokens = _tokenize(expression)
+    position = 0
+
+    def parse_operand() -> ItemIdSet:
+        nonlocal position
+        if position >= len(tokens):
+            raise ValueError("Unexpected end of expression")
+        kind, value = tokens[position]
+        position += 1
+        if kind == "name":
+            return store.lookup(value)
+        if value == "(":
+            result = parse_expression()
+            if position >= len(tokens) or tokens[position] != ("op", ")"):
+                raise ValueError("Missing closing parenthesis")
+            position += 1
+            return result
+        raise ValueError(f"Unexpected operator '{value}'")
+
+    def parse_expression() -> ItemIdSet:
+        nonlocal position
+        result = parse_operand()
+        while position < len(tokens) and tokens[position][0] == "op" and tokens[position][1] in "|&-^":
+            operator = tokens[position][1]
+            position += 1
+            operand = parse_operand()
+            if operator == "|":
+                result = result | operand
+            elif operator == "&":
+                result = result & operand
+            elif operator == "-":
+                result = result - operand
+            else:
+                result = result ^ operand
+        return result
+
+    result = parse_expression()
+    if position != len(tokens):
+        raise ValueError(f"Unexpected token '{tokens[position][1]}'")
+    return result
@@ -0,0 +1,220 @@
+import asyncio
+import json
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from osrs_scraper.api.async_wiki_api import AsyncWikiClient
+from osrs_scraper.data.item_database import ItemIndex, load_item_database, get_item_id
+from osrs_scraper.data.item_sets import ItemSetStore
+from osrs_scraper.utils.file_operations import save_drops_to_file, save_banklayout
+from osrs_scraper.utils.logging import log_parsed_data
+
+DEFAULT_STATE_PATH = os.path.join("Droplists", "refresh_state.json")
+
+# The wiki keeps recent changes for 30 days; anything older gets a full re-fetch.
+RECENT_CHANGES_WINDOW = timedelta(days=29)
+
+# A full refresh can re-fetch every tracked page, so it goes much easier on the public wiki than interactive searches.
+DEFAULT_REFRESH_MAX_IN_FLIGHT = 8
+
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+def utc_timestamp(moment: Optional[datetime] = None) -> str:
+    return (moment or datetime.now(timezone.utc)).strftime(TIMESTAMP_FORMAT)
+
+class RefreshState:
+    """
+    The searches whose outputs a refresh keeps up to date, persisted between runs.
+    Each search records the options it ran with and, per monster, the arguments its outputs were written with,
+    so a refresh can rewrite exactly the same files. Pages whose fetch failed are kept in the search's
+    "pending_pages" (and a failed category listing sets "members_pending"), and the search's "synced_at"
+    only moves forward once nothing is pending, so failed fetches are retried on the next refresh.
+    """
+
+    def __init__(self, path: str = DEFAULT_STATE_PATH):
+        self.path = path
+        self.searches: Dict[str, Dict] = {}
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_STATE_PATH) -> "RefreshState":
+        state = cls(path)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                state.searches = json.load(f).get("searches", {})
+        except (FileNotFoundError, json.JSONDecodeError):
+            pass
+        return state
+
+    def save(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump({"searches": self.searches}, f, indent=2, ensure_ascii=False)
+
+    def track(self, search_name: str, search_type: str, file_path: str, monsters: List[Dict], args, synced_at: str, members_pending: bool = False) -> None:
+        """
+        Record a finished search. Each monster is a dict with the page that was requested ("page"),
+        the name its drops were saved under ("name"), and the category and file path passed to save_drops_to_file.
+        Set `members_pending` when some category members could not be checked, so the next refresh checks them again.
+        """
+        self.searches[search_name] = {
+            "type": search_type,
+            "file_path": file_path,
+            "synced_at": synced_at,
+            "options": {"txt": args.txt, "id": args.id, "sort": args.sort, "banklayout": args.banklayout},
+            "monsters": monsters,
+        }
+        if members_pending:
+            self.searches[search_name]["members_pending"] = True
+
+    def last_sync(self) -> Optional[str]:
+        return min((search["synced_at"] for search in self.searches.values()), default=None)
+
+class RefreshSummary:
+    def __init__(self):
+        self.searches_checked = 0
+        self.searches_updated = 0
+        self.pages_changed = 0
+        self.pages_fetched = 0
+        self.pages_failed = 0
+        self.searches_pending = 0
+        self.full_refresh = False
+
+async def refresh_tracked_searches(client: AsyncWikiClient, state: RefreshState, item_sets: ItemSetStore, item_db: Dict[str, Dict], item_index: Optional[ItemIndex] = None) -> RefreshSummary:
+    """
+    Bring the outputs of every tracked search up to date.
+    Asks the wiki's recent-changes feed which tracked pages changed since the last sync, then re-fetches and
+    re-parses only those pages and rewrites only the JSON, ID and bank layout files they affect.
+    """
+    summary = RefreshSummary()
+    summary.searches_checked = len(state.searches)
+    if not state.searches:
+        return summary
+
+    started_at = utc_timestamp()
+    since = state.last_sync()
+    summary.full_refresh = since is None or datetime.strptime(since, TIMESTAMP_FORMAT).replace(tzinfo=timezone.utc) < datetime.now(timezone.utc) - RECENT_CHANGES_WINDOW
+    changed_titles = set() if summary.full_refresh else await client.get_recent_changes(since)
+
+    # Pick up category membership changes first, so new monsters are fetched with everything else
+    for search_name, search in state.searches.items():
+        if search["type"] == "category" and (summary.full_refresh or search.get("members_pending") or f"Category:{search_name}" in changed_titles):
+            await _update_category_members(client, search_name, search)
+
+    pages_to_fetch = {
+        monster["page"]
+        for search in state.searches.values()
+        for monster in search["monsters"]
+        if summary.full_refresh or monster.get("new") or monster["page"] in changed_titles or monster["name"] in changed_titles
+        or monster["page"] in search.get("pending_pages", ())
+    }
+    summary.pages_changed = len(pages_to_fetch)
+
+    # One failed page must not abort the others, so exceptions are collected per page
+    pages = sorted(pages_to_fetch)
+    results = await asyncio.gather(*(client.fetch_monster_page(page) for page in pages), return_exceptions=True)
+    fetched = {}
+    failed = set()
+    for page, result in zip(pages, results):
+        if isinstance(result, BaseException):
+            print(f"Warning: Failed to fetch '{page}' ({str(result) or type(result).__name__}). It will be retried on the next refresh.")
+            failed.add(page)
+        else:
+            fetched[page] = result
+    summary.pages_fetched = len(fetched)
+    summary.pages_failed = len(failed)
+
+    for search_name, search in state.searches.items():
+        changed_monsters = [monster for monster in search["monsters"] if monster["page"] in fetched]
+        members_changed = search.pop("members_changed", False)
+        if (changed_monsters or members_changed) and _rewrite_search_outputs(search_name, search, changed_monsters, fetched, item_sets, item_db, item_index, members_changed):
+            summary.searches_updated += 1
+
+        pending_pages = sorted({monster["page"] for monster in search["monsters"] if monster["page"] in failed})
+        if pending_pages or search.get("members_pending"):
+            search["pending_pages"] = pending_pages
+            summary.searches_pending += 1
+        else:
+            search.pop("pending_pages", None)
+            search["synced_at"] = started_at
+
+    item_sets.save()
+    state.save()
+    return summary
+
+async def _update_category_members(client: AsyncWikiClient, search_name: str, search: Dict) -> None:
+    """Update a category search's monsters; sets "members_pending" when the listing or a monster check failed."""
+    try:
+        members = await client.get_category_members(search_name)
+    except Exception as e:
+        print(f"Warning: Failed to fetch category '{search_name}' ({str(e) or type(e).__name__}). It will be retried on the next refresh.")
+        search["members_pending"] = True
+        return
+
+    tracked = {monster["page"] for monster in search["monsters"]}
+    new_entries = [entry for entry in members if entry not in tracked]
+    is_monster_results = await asyncio.gather(*(client.is_monster(entry) for entry in new_entries), return_exceptions=True)
+
+    member_set = set(members)
+    kept = [monster for monster in search["monsters"] if monster["page"] in member_set]
+    added = [
+        {"page": entry, "name": entry, "category": search_name, "file_path": search["file_path"], "new": True}
+        for entry, is_monster in zip(new_entries, is_monster_results)
+        if is_monster is True
+    ]
+    # A failed check (None or an exception) leaves the entry out for now; the listing is checked again next refresh
+    if any(result is None or isinstance(result, BaseException) for result in is_monster_results):
+        search["members_pending"] = True
+    else:
+        search.pop("members_pending", None)
+    if added or len(kept) != len(search["monsters"]):
+        search["members_changed"] = True
+    search["monsters"] = kept + added
+    log_parsed_data(search_name, "refreshed_members", [monster["page"] for monster in search["monsters"]])
+
+def _rewrite_search_outputs(search_name: str, search: Dict, changed_monsters: List[Dict], fetched: Dict, item_sets: ItemSetStore, item_db: Dict[str, Dict], item_index: Optional[ItemIndex], members_changed: bool) -> bool:
+    """Rewrite the outputs affected by the fetched pages and return whether anything was rewritten."""
+    options = search["options"]
+    rewritten = False
+    for monster in changed_monsters:
+        page = fetched[monster["page"]]
+        is_new = monster.pop("new", False)
+        if not page.items:
+            print(f"Warning: Monster '{monster['page']}' not found or has no drops. Keeping previous output.")
+            continue
+        if not is_new and page.revid is not None and page.revid == monster.get("revid"):
+            continue  # Only the page's log or categories changed, not its content
+        monster["revid"] = page.revid
+        monster["name"] = page.redirected_name(monster["page"]) or monster["name"]
+        drops = page.items
+        drops_with_ids = [(item, get_item_id(item, item_db, item_index)) for item in drops if item.lower() != "nothing"]
+        item_sets.set_monster(monster["name"], (item_id for _, item_id in drops_with_ids if item_id is not None))
+        if not options["banklayout"]:
+            save_drops_to_file(monster["category"], monster["name"], drops_with_ids, monster["file_path"], False, options["id"], options["sort"], False, overwrite_ids=True)
+        rewritten = True
+
+    if not rewritten and not members_changed:
+        return False
+
+    if search["type"] == "category" or options["banklayout"]:
+        all_unique_ids = set()
+        for monster in search["monsters"]:
+            if monster["name"] in item_sets.monsters:
+                all_unique_ids.update(item_sets.monsters[monster["name"]])
+        if search["type"] == "category":
+            item_sets.set_category(search_name, all_unique_ids)
+        if options["banklayout"]:
+            save_banklayout(search_name, all_unique_ids, search["file_path"], options["sort"])
+    return True
+
+async def _run_refresh(base_url: str, item_db_path: str, max_in_flight: int) -> RefreshSummary:
+    item_db = load_item_database(item_db_path)
+    item_index = ItemIndex(item_db) if item_db else None
+    async with AsyncWikiClient(base_url, max_in_flight=max_in_flight) as client:
+        return await refresh_tracked_searches(client, RefreshState.load(), ItemSetStore.load(), item_db, item_index)
+
+def run_refresh(base_url: str, item_db_path: str = 'assets/item-db.json', max_in_flight: int = DEFAULT_REFRESH_MAX_IN_FLIGHT) -> RefreshSummary:
+    """Refresh every tracked search from the command line."""
+    return asyncio.run(_run_refresh(base_url, item_db_path, max_in_flight))
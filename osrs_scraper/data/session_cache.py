@@ -0,0 +1,77 @@
+from typing import Callable, Dict, Iterable, Optional, Tuple, TypeVar
+
+from osrs_scraper.api.wiki_api import MonsterPage, get_category_members, get_monster_drops, is_monster
+from osrs_scraper.data.item_database import ItemIndex, load_item_database, get_item_id
+from osrs_scraper.data.refresh import utc_timestamp
+from osrs_scraper.utils.lru_cache import LRUCache
+
+T = TypeVar("T")
+
+# Process-lifetime caches shared by every search in the interactive loop.
+# Category listings and monster pages are stored as (fetched_at, value), so a search knows how old its data is.
+_caches: Dict[str, LRUCache] = {
+    "item_database": LRUCache(2),
+    "item_index": LRUCache(2),
+    "category_members": LRUCache(128),
+    "is_monster": LRUCache(8192),
+    "monster_drops": LRUCache(4096),
+    "item_ids": LRUCache(32768),
+}
+
+def cached_load_item_database(file_path: str = 'assets/item-db.json') -> Dict[str, Dict]:
+    """Load the item database once per process; an empty (missing) database is retried."""
+    return _caches["item_database"].get_or_compute(file_path, lambda: load_item_database(file_path), bool)
+
+def cached_item_index(file_path: str = 'assets/item-db.json') -> ItemIndex:
+    """Build the name and trigram index once per loaded item database."""
+    item_db = cached_load_item_database(file_path)
+    return _caches["item_index"].get_or_compute(file_path, lambda: ItemIndex(item_db), lambda item_index: bool(item_db))
+
+def _timed(fetch: Callable[[], T]) -> Callable[[], Tuple[str, T]]:
+    # The time is taken before the request, so an edit made while it is in flight counts as newer
+    return lambda: (utc_timestamp(), fetch())
+
+def cached_get_category_members(category_name: str) -> list[str]:
+    return _caches["category_members"].get_or_compute(
+        category_name,
+        _timed(lambda: get_category_members(category_name)),
+        lambda entry: bool(entry[1]),
+    )[1]
+
+def cached_is_monster(entry: str) -> Optional[bool]:
+    """Cache real answers only; a failed check (None) is retried on the next search."""
+    return _caches["is_monster"].get_or_compute(entry, lambda: is_monster(entry), lambda result: result is not None)
+
+def cached_get_monster_drops(monster_name: str) -> MonsterPage:
+    """Cache parsed drops per page; failed or empty fetches are not memoized so they can be retried."""
+    return _caches["monster_drops"].get_or_compute(
+        monster_name,
+        _timed(lambda: get_monster_drops(monster_name)),
+        lambda entry: bool(entry[1].items),
+    )[1]
+
+def oldest_fetch_time(default: str, category_name: Optional[str] = None, monster_names: Iterable[str] = ()) -> str:
+    """
+    The earliest time the cached category listing or monster pages were fetched, or `default` if all of them are newer.
+    Data served from memory can predate the search that used it, so this is the time the search is in sync with the wiki.
+    """
+    entries = [_caches["monster_drops"].peek(name) for name in monster_names]
+    if category_name is not None:
+        entries.append(_caches["category_members"].peek(category_name))
+    return min((entry[0] for entry in entries if entry is not None), default=default)
+
+def cached_get_item_id(item_name: str, item_db: Dict[str, Dict], item_index: Optional[ItemIndex] = None) -> Optional[int]:
+    # Lookups against an empty (missing) database are not memoized.
+    return _caches["item_ids"].get_or_compute(item_name, lambda: get_item_id(item_name, item_db, item_index), lambda item_id: bool(item_db))
+
+# Wiki lookups that a later search can reuse. Item ID hits are left out: the same item ("Coins", "Bones")
+# repeats within a single search, so counting them would report memory hits on a cold cache.
+_WIKI_CACHES = ("category_members", "is_monster", "monster_drops")
+
+def memory_hits() -> int:
+    """Total number of wiki lookups served from memory since the process started."""
+    return sum(_caches[name].hits for name in _WIKI_CACHES)
+
+def clear_session_cache() -> None:
+    for cache in _caches.values():
+        cache.clear()
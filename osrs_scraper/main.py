@@ -8,32 +8,42 @@ parent_dir = os.path.dirname(current_dir)
 sys.path.insert(0, parent_dir)
 
 import argparse
-from rich.console import Console
-from rich.live import Live
-from rich.progress import Progress, TaskID
-
-from osrs_scraper.api.wiki_api import get_category_members, get_monster_drops, is_monster
-from osrs_scraper.data.item_database import load_item_database, get_item_id
-from osrs_scraper.utils.file_operations import save_drops_to_file, create_output_file, save_banklayout
-from osrs_scraper.utils.logging import log_parsed_data, set_logging
-from osrs_scraper.ui.components import (
-    create_welcome_screen,
-    get_search_type,
-    get_input,
-    create_drops_table,
-    create_summary_message,
-    ask_for_another_search,
-)
-from osrs_scraper.ui.layout import (
-    create_layout,
-    update_layout,
-)
+
+from osrs_scraper.data.item_sets import ItemSetStore, evaluate_set_expression
+from osrs_scraper.api.wiki_api import BASE_URL
+from osrs_scraper.utils.file_operations import create_output_file, save_banklayout
+from osrs_scraper.utils.logging import set_logging
 
 def remove_existing_logs():
     log_dir = os.path.join(current_dir, "Logs")
     if os.path.exists(log_dir):
         shutil.rmtree(log_dir)
 
+def combine_saved_sets(expression: str, tag: str, sort_ids: bool) -> None:
+    """Write a bank layout for a set expression over saved item sets."""
+    try:
+        combined = evaluate_set_expression(expression, ItemSetStore.load())
+    except (KeyError, ValueError) as e:
+        print(f"Error: {e.args[0]}")
+        sys.exit(1)
+    file_path = create_output_file(tag)
+    save_banklayout(tag, set(combined), file_path.rsplit('.', 1)[0], sort_ids)
+    print(f"Saved {len(combined)} items to {file_path.rsplit('.', 1)[0]}_banklayout.txt")
+
+def refresh_tracked_searches(api_url: str) -> None:
+    """Update the outputs of every tracked search from the wiki's recent changes."""
+    from osrs_scraper.data.refresh import run_refresh
+
+    summary = run_refresh(api_url)
+    if not summary.searches_checked:
+        print("No tracked searches yet. Run a search first.")
+        return
+    mode = "full refresh" if summary.full_refresh else "changed pages only"
+    print(f"Checked {summary.searches_checked} searches ({mode}): {summary.pages_changed} pages changed, "
+          f"{summary.pages_fetched} fetched, {summary.searches_updated} searches updated")
+    if summary.searches_pending:
+        print(f"{summary.pages_failed} pages failed to fetch; {summary.searches_pending} searches will retry them on the next refresh")
+
 def main():
     parser = argparse.ArgumentParser(
         description="OSRS Wiki Search",
@@ -68,6 +78,31 @@ def main():
         default=True,
         help="Create a RuneLite bank layout file (default: True)"
     )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Also save all drop tables of a search to a compact, compressed .odx file"
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Re-fetch only the tracked monster pages that changed on the wiki since the last sync and update their outputs"
+    )
+    parser.add_argument(
+        "--api-url",
+        default=BASE_URL,
+        help=f"OSRS Wiki API endpoint (default: {BASE_URL})"
+    )
+    parser.add_argument(
+        "--combine",
+        metavar="EXPRESSION",
+        help="Combine saved item sets with a set expression and write a RuneLite bank layout without any wiki requests"
+    )
+    parser.add_argument(
+        "--tag",
+        help="Bank tag name for the layout written by --combine (default: combined)",
+        default="combined"
+    )
     
     # Add a more detailed description
     parser.description = """
@@ -88,152 +123,34 @@ Use the --logs option to enable detailed logging for debugging.
 Use the --txt option to save drop tables in both JSON and TXT formats.
 Use the --id option to save only item IDs as a comma-separated list in a txt file.
 Use the --sort option with --id to sort the item IDs from small to large.
+Use the --compact option to also save a compressed columnar .odx export of the search
+(read it back with osrs_scraper.utils.drop_export.iter_drop_export).
+Use the --refresh option to update the outputs of earlier searches, re-fetching only the
+monster pages that changed on the wiki since they were last synced.
+Use the --combine option to build a bank layout from item sets saved by earlier searches,
+e.g. --combine '"Zulrah" - "Vorkath"' --tag zulrah_only. Supported operators are
+| (union), & (intersection), - (difference) and ^ (symmetric difference).
     """
     
     args = parser.parse_args()
 
+    if args.combine:
+        combine_saved_sets(args.combine, args.tag, args.sort)
+        return
+
     remove_existing_logs()
     set_logging(args.logs)
-    console = Console()
-    
-    while True:
-        # Display welcome screen
-        welcome_screen = create_welcome_screen(console)
-        with Live(welcome_screen, console=console, screen=True, refresh_per_second=4):
-            console.input()
-        
-        console.clear()
-        
-        search_type = get_search_type()
-        if search_type is None:
-            console.print("[bold red]Search cancelled. Exiting...[/bold red]")
-            return
-
-        search_input = get_input(console, search_type)
-        item_db = load_item_database()
-        if not item_db:
-            console.print("[bold red]Warning: Item database is empty. Item IDs will not be available.[/bold red]")
-            console.print("Press Enter to continue anyway, or Ctrl+C to exit.")
-            console.input()
-
-        layout = create_layout()
-        
-        file_path = create_output_file(search_input)
-        
-        completed_steps = [False, False, False, False, False, False]
-        
-        with Live(layout, console=console, screen=True, refresh_per_second=4) as live:
-            update_layout(layout, search_input, [], console.height, completed_steps)
-            live.refresh()
-
-            completed_steps[0] = True  # Initializing
-            update_layout(layout, search_input, [], console.height, completed_steps)
-            live.refresh()
-
-            while True:
-                if search_type == "category":
-                    all_entries = get_category_members(search_input)
-                    completed_steps[1] = True  # Fetching category members
-                    update_layout(layout, search_input, [], console.height, completed_steps)
-                    live.refresh()
-
-                    if not all_entries:
-                        console.print(f"[bold red]Error: Category '{search_input}' not found or empty.[/bold red]")
-                        search_input = get_input(console, search_type)
-                        continue
-
-                    monster_progress = Progress()
-                    drop_progress = Progress()
-                    monster_task = monster_progress.add_task("[cyan]Filtering monsters...", total=len(all_entries))
-                    
-                    monsters = []
-                    for entry in all_entries:
-                        if is_monster(entry):
-                            monsters.append(entry)
-                        monster_progress.update(monster_task, advance=1)
-                        update_layout(layout, search_input, monsters, console.height, completed_steps, progress_bars=(monster_progress, drop_progress))
-                        live.refresh()
-                    
-                    completed_steps[2] = True  # Filtering monsters
-                    update_layout(layout, search_input, monsters, console.height, completed_steps, progress_bars=(monster_progress, drop_progress))
-                    live.refresh()
-                    
-                    if args.logs:
-                        log_parsed_data(search_input, "filtered_monsters", monsters)
-                    
-                    if not monsters:
-                        console.print(f"[bold red]Error: No monsters found in category '{search_input}'.[/bold red]")
-                        search_input = get_input(console, search_type)
-                        continue
-                else:
-                    monsters = [search_input]
-                    completed_steps[1] = True
-                    completed_steps[2] = True
-                    monster_progress = Progress()
-                    drop_progress = Progress()
-                
-                drop_task = drop_progress.add_task("[yellow]Fetching drops...", total=len(monsters))
-                
-                completed_steps[3] = True  # Fetching drop tables
-                update_layout(layout, search_input, monsters, console.height, completed_steps, progress_bars=(monster_progress, drop_progress))
-                live.refresh()
-
-                all_unique_ids = set()
-                monster_not_found = False
-                total_items = 0
-                for monster in monsters:
-                    drops, redirected_name = get_monster_drops(monster)
-                    if not drops:
-                        console.print(f"[bold yellow]Warning: Monster '{monster}' not found or has no drops. Skipping...[/bold yellow]")
-                        drop_progress.update(drop_task, advance=1)
-                        live.refresh()
-                        continue
-                    
-                    # Use redirected_name if available, otherwise use the original monster name
-                    monster_name = redirected_name or monster
-                    
-                    # Update file_path with the redirected name if available
-                    if redirected_name:
-                        file_path = file_path.replace(search_input, redirected_name)
-                    
-                    # Update search_input if redirected
-                    if search_type == "monster" and redirected_name:
-                        search_input = redirected_name
-                    
-                    drops_with_ids = [(item, get_item_id(item, item_db)) for item in drops if item.lower() != "nothing"]
-                    total_items += len(drops_with_ids)
-                    if args.banklayout:
-                        monster_unique_ids = {get_item_id(item, item_db) for item, _ in drops_with_ids if get_item_id(item, item_db) is not None}
-                        all_unique_ids.update(monster_unique_ids)
-                    else:
-                        save_drops_to_file(redirected_name or search_input, monster_name, drops_with_ids, file_path.rsplit('.', 1)[0], args.txt, args.id, args.sort, False)
-                    
-                    if not args.id and not args.banklayout:
-                        drops_table = create_drops_table(drops_with_ids)
-                        update_layout(layout, search_input, monsters, console.height, completed_steps, monster_name, drops_table, progress_bars=(monster_progress, drop_progress))
-                    drop_progress.update(drop_task, advance=1)
-                    live.refresh()
-                
-                break  # Exit the loop if everything was successful
-
-            if args.banklayout:
-                save_banklayout(search_input, all_unique_ids, file_path.rsplit('.', 1)[0], args.sort)
-            
-            completed_steps[4] = True  # Saving data
-            update_layout(layout, search_input, monsters, console.height, completed_steps, progress_bars=(monster_progress, drop_progress))
-            live.refresh()
-
-            completed_steps[5] = True  # Finalizing
-            update_layout(layout, search_input, monsters, console.height, completed_steps, progress_bars=(monster_progress, drop_progress))
-            live.refresh()
-
-        # Display summary message
-        summary = create_summary_message(search_type, search_input, monsters, total_items, file_path, args)
-        console.print(summary)
-
-        # Ask if the user wants to do another search
-        if not ask_for_another_search(console):
-            break
+
+    if args.refresh:
+        refresh_tracked_searches(args.api_url)
+        return
+
+    from osrs_scraper.api.async_wiki_api import set_shared_base_url
+    set_shared_base_url(args.api_url)
+
+    # The interactive TUI (rich, prompt_toolkit, art) is only imported when it is actually used
+    from osrs_scraper.ui.app import run_interactive
+    run_interactive(args)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,213 @@
+from rich.console import Console
+from rich.live import Live
+from rich.progress import Progress
+
+from osrs_scraper.data.session_cache import (
+    cached_load_item_database,
+    cached_item_index,
+    cached_get_category_members,
+    cached_is_monster,
+    cached_get_monster_drops,
+    cached_get_item_id,
+    memory_hits,
+    oldest_fetch_time,
+)
+from osrs_scraper.data.item_sets import ItemSetStore
+from osrs_scraper.data.refresh import RefreshState, utc_timestamp
+from osrs_scraper.utils.file_operations import save_drops_to_file, create_output_file, save_banklayout
+from osrs_scraper.utils.drop_export import save_drop_export
+from osrs_scraper.utils.logging import log_parsed_data
+from osrs_scraper.ui.components import (
+    create_welcome_screen,
+    get_search_type,
+    get_input,
+    create_drops_table,
+    create_summary_message,
+    ask_for_another_search,
+)
+from osrs_scraper.ui.layout import (
+    create_layout,
+    update_layout,
+)
+
+def run_interactive(args) -> None:
+    """Run the interactive search loop until the user chooses to exit."""
+    console = Console()
+    item_sets = ItemSetStore.load()
+    
+    while True:
+        # Display welcome screen
+        welcome_screen = create_welcome_screen(console)
+        with Live(welcome_screen, console=console, screen=True, refresh_per_second=4):
+            console.input()
+        
+        console.clear()
+        
+        search_type = get_search_type()
+        if search_type is None:
+            console.print("[bold red]Search cancelled. Exiting...[/bold red]")
+            return
+
+        search_input = get_input(console, search_type)
+        search_started_at = utc_timestamp()
+        item_db = cached_load_item_database()
+        item_index = cached_item_index()
+        hits_before_search = memory_hits()
+        if not item_db:
+            console.print("[bold red]Warning: Item database is empty. Item IDs will not be available.[/bold red]")
+            console.print("Press Enter to continue anyway, or Ctrl+C to exit.")
+            console.input()
+
+        layout = create_layout()
+        
+        file_path = create_output_file(search_input)
+        
+        completed_steps = [False, False, False, False, False, False]
+        
+        with Live(layout, console=console, screen=True, refresh_per_second=4) as live:
+            update_layout(layout, search_input, [], console.height, completed_steps)
+            live.refresh()
+
+            completed_steps[0] = True  # Initializing
+            update_layout(layout, search_input, [], console.height, completed_steps)
+            live.refresh()
+
+            while True:
+                if search_type == "category":
+                    all_entries = cached_get_category_members(search_input)
+                    completed_steps[1] = True  # Fetching category members
+                    update_layout(layout, search_input, [], console.height, completed_steps)
+                    live.refresh()
+
+                    if not all_entries:
+                        console.print(f"[bold red]Error: Category '{search_input}' not found or empty.[/bold red]")
+                        search_input = get_input(console, search_type)
+                        continue
+
+                    monster_progress = Progress()
+                    drop_progress = Progress()
+                    monster_task = monster_progress.add_task("[cyan]Filtering monsters...", total=len(all_entries))
+                    
+                    monsters = []
+                    unchecked_entries = []
+                    for entry in all_entries:
+                        entry_is_monster = cached_is_monster(entry)
+                        if entry_is_monster:
+                            monsters.append(entry)
+                        elif entry_is_monster is None:
+                            unchecked_entries.append(entry)  # The check failed; the next refresh tries it again
+                        monster_progress.update(monster_task, advance=1)
+                        update_layout(layout, search_input, monsters, console.height, completed_steps, progress_bars=(monster_progress, drop_progress))
+                        live.refresh()
+                    
+                    completed_steps[2] = True  # Filtering monsters
+                    update_layout(layout, search_input, monsters, console.height, completed_steps, progress_bars=(monster_progress, drop_progress))
+                    live.refresh()
+                    
+                    if args.logs:
+                        log_parsed_data(search_input, "filtered_monsters", monsters)
+
+                    if unchecked_entries:
+                        console.print(f"[bold yellow]Warning: Could not check {len(unchecked_entries)} entries; they will be checked again on the next --refresh.[/bold yellow]")
+                    
+                    if not monsters:
+                        console.print(f"[bold red]Error: No monsters found in category '{search_input}'.[/bold red]")
+                        search_input = get_input(console, search_type)
+                        continue
+                else:
+                    monsters = [search_input]
+                    unchecked_entries = []
+                    completed_steps[1] = True
+                    completed_steps[2] = True
+                    monster_progress = Progress()
+                    drop_progress = Progress()
+                
+                drop_task = drop_progress.add_task("[yellow]Fetching drops...", total=len(monsters))
+                
+                completed_steps[3] = True  # Fetching drop tables
+                update_layout(layout, search_input, monsters, console.height, completed_steps, progress_bars=(monster_progress, drop_progress))
+                live.refresh()
+
+                all_unique_ids = set()
+                export_drops = {}
+                tracked_monsters = []
+                category_ids = set()
+                monster_not_found = False
+                total_items = 0
+                for monster in monsters:
+                    page = cached_get_monster_drops(monster)
+                    drops = page.items
+                    redirected_name = page.redirected_name(monster)
+                    tracked_monsters.append({"page": monster, "name": monster, "category": search_input, "file_path": file_path.rsplit('.', 1)[0], "revid": page.revid})
+                    if page.revid is None:
+                        tracked_monsters[-1]["new"] = True  # Fetch failed or page missing; the next refresh tries it again
+                    if not drops:
+                        console.print(f"[bold yellow]Warning: Monster '{monster}' not found or has no drops. Skipping...[/bold yellow]")
+                        drop_progress.update(drop_task, advance=1)
+                        live.refresh()
+                        continue
+                    
+                    # Use redirected_name if available, otherwise use the original monster name
+                    monster_name = redirected_name or monster
+                    
+                    # Update file_path with the redirected name if available
+                    if redirected_name:
+                        file_path = file_path.replace(search_input, redirected_name)
+                    
+                    # Update search_input if redirected
+                    if search_type == "monster" and redirected_name:
+                        search_input = redirected_name
+                    
+                    tracked_monsters[-1].update(name=monster_name, category=redirected_name or search_input, file_path=file_path.rsplit('.', 1)[0])
+                    
+                    drops_with_ids = [(item, cached_get_item_id(item, item_db, item_index)) for item in drops if item.lower() != "nothing"]
+                    total_items += len(drops_with_ids)
+                    monster_unique_ids = {item_id for _, item_id in drops_with_ids if item_id is not None}
+                    item_sets.set_monster(monster_name, monster_unique_ids)
+                    category_ids.update(monster_unique_ids)
+                    if args.compact:
+                        export_drops[monster_name] = drops_with_ids
+                    if args.banklayout:
+                        all_unique_ids.update(monster_unique_ids)
+                    else:
+                        save_drops_to_file(redirected_name or search_input, monster_name, drops_with_ids, file_path.rsplit('.', 1)[0], args.txt, args.id, args.sort, False)
+                    
+                    if not args.id and not args.banklayout:
+                        drops_table = create_drops_table(drops_with_ids)
+                        update_layout(layout, search_input, monsters, console.height, completed_steps, monster_name, drops_table, progress_bars=(monster_progress, drop_progress))
+                    drop_progress.update(drop_task, advance=1)
+                    live.refresh()
+                
+                break  # Exit the loop if everything was successful
+
+            if search_type == "category":
+                item_sets.set_category(search_input, category_ids)
+            item_sets.save()
+
+            # Pages and listings served from memory may be older than this search
+            synced_at = oldest_fetch_time(search_started_at, search_input if search_type == "category" else None, monsters)
+            refresh_state = RefreshState.load()
+            refresh_state.track(search_input, search_type, file_path.rsplit('.', 1)[0], tracked_monsters, args, synced_at, members_pending=bool(unchecked_entries))
+            refresh_state.save()
+
+            if args.compact:
+                save_drop_export(file_path.rsplit('.', 1)[0], export_drops)
+
+            if args.banklayout:
+                save_banklayout(search_input, all_unique_ids, file_path.rsplit('.', 1)[0], args.sort)
+            
+            completed_steps[4] = True  # Saving data
+            update_layout(layout, search_input, monsters, console.height, completed_steps, progress_bars=(monster_progress, drop_progress))
+            live.refresh()
+
+            completed_steps[5] = True  # Finalizing
+            update_layout(layout, search_input, monsters, console.height, completed_steps, progress_bars=(monster_progress, drop_progress))
+            live.refresh()
+
+        # Display summary message
+        summary = create_summary_message(search_type, search_input, monsters, total_items, file_path, args, memory_hits() - hits_before_search)
+        console.print(summary)
+
+        # Ask if the user wants to do another search
+        if not ask_for_another_search(console):
+            break
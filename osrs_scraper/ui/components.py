@@ -9,28 +9,16 @@ from rich.prompt import Prompt
 from rich.console import Group
 from rich.padding import Padding
 from rich.live import Live
-from art import text2art
-from prompt_toolkit import prompt
-from prompt_toolkit.shortcuts import PromptSession
-from prompt_toolkit.application import Application
-from prompt_toolkit.key_binding import KeyBindings
-from prompt_toolkit.layout.containers import Window
-from prompt_toolkit.layout.controls import FormattedTextControl
-from prompt_toolkit.layout import Layout
 
-def create_welcome_screen(console: Console) -> Panel:
-    welcome_text = Text()
-    title_art = text2art("Drops", font="block", chr_ignore=True)
-    welcome_text.append(title_art + "\n", style="bold magenta")
-    welcome_text.append("Welcome to the OSRS Wiki Search Tool!\n\n", style="bold green")
-    welcome_text.append("This tool allows you to search for monsters in a specific category or get drops for a specific monster.\n\n")
-    welcome_text.append("When searching by category, you can enter a number to quickly select from the example categories.\n\n")
-    welcome_text.append("Press Enter to continue...", style="bold yellow")
-    
-    return Panel(welcome_text, title="Welcome", border_style="bold blue", expand=True, height=console.height)
+def _run_menu(options: list[str]) -> str:
+    """Show a full-screen up/down menu and return the selected option."""
+    # The prompt_toolkit application stack is only imported once a menu is actually shown
+    from prompt_toolkit.application import Application
+    from prompt_toolkit.key_binding import KeyBindings
+    from prompt_toolkit.layout.containers import Window
+    from prompt_toolkit.layout.controls import FormattedTextControl
+    from prompt_toolkit.layout import Layout
 
-def get_search_type() -> str:
-    options = ["Search by Category", "Search by Monster"]
     selected = 0
 
     def get_formatted_text():
@@ -65,7 +53,24 @@ def get_search_type() -> str:
         full_screen=True,
     )
 
-    result = application.run()
+    return application.run()
+
+def create_welcome_screen(console: Console) -> Panel:
+    from art import text2art
+
+    welcome_text = Text()
+    title_art = text2art("Drops", font="block", chr_ignore=True)
+    welcome_text.append(title_art + "\n", style="bold magenta")
+    welcome_text.append("Welcome to the OSRS Wiki Search Tool!\n\n", style="bold green")
+    welcome_text.append("This tool allows you to search for monsters in a specific category or get drops for a specific monster.\n\n")
+    welcome_text.append("When searching by category, you can enter a number to quickly select from the example categories.\n\n")
+    welcome_text.append("Press Enter to continue...", style="bold yellow")
+    
+    return Panel(welcome_text, title="Welcome", border_style="bold blue", expand=True, height=console.height)
+
+def get_search_type() -> str:
+    options = ["Search by Category", "Search by Monster"]
+    result = _run_menu(options)
     return "category" if result == "Search by Category" else "monster"
 
 def get_input(console: Console, input_type: str) -> str:
@@ -138,7 +143,7 @@ def create_drops_table(drops):
     
     return drops_table
 
-def create_summary_message(search_type: str, search_input: str, monsters: list, total_items: int, file_path: str, args) -> Panel:
+def create_summary_message(search_type: str, search_input: str, monsters: list, total_items: int, file_path: str, args, cache_hits: int = 0) -> Panel:
     summary_text = Text()
     summary_text.append("Search Complete!\n\n", style="bold green")
     
@@ -152,7 +157,9 @@ def create_summary_message(search_type: str, search_input: str, monsters: list,
         summary_text.append(f"{search_input}\n", style="bold white")
     
     summary_text.append(f"Total items found: ", style="cyan")
-    summary_text.append(f"{total_items}\n\n", style="bold white")
+    summary_text.append(f"{total_items}\n", style="bold white")
+    summary_text.append(f"Served from memory: ", style="cyan")
+    summary_text.append(f"{cache_hits}\n\n", style="bold white")
     
     summary_text.append("Files saved:\n", style="yellow")
     if args.id and not args.banklayout:
@@ -164,46 +171,14 @@ def create_summary_message(search_type: str, search_input: str, monsters: list,
     if not args.id and not args.banklayout:
         summary_text.append(f"- Drop tables: ", style="green")
         summary_text.append(f"{file_path}\n", style="italic white")
+    if args.compact:
+        summary_text.append(f"- Compact export: ", style="green")
+        summary_text.append(f"{file_path.rsplit('.', 1)[0]}.odx\n", style="italic white")
     
     return Panel(summary_text, title="Summary", border_style="bold blue", expand=False, padding=(1, 1))
 
 def ask_for_another_search(console: Console) -> bool:
     options = ["Yes, do another search", "No, exit the tool"]
-    selected = 0
-
-    def get_formatted_text():
-        result = []
-        for i, option in enumerate(options):
-            if i == selected:
-                result.append(("class:selected", f">> {option}"))
-            else:
-                result.append(("", f"   {option}"))
-            result.append(("", "\n"))
-        return result
-
-    kb = KeyBindings()
-
-    @kb.add("up")
-    def _(event):
-        nonlocal selected
-        selected = (selected - 1) % len(options)
-
-    @kb.add("down")
-    def _(event):
-        nonlocal selected
-        selected = (selected + 1) % len(options)
-
-    @kb.add("enter")
-    def _(event):
-        event.app.exit(result=options[selected])
-
     console.print("\nDo you want to do another search?", style="bold cyan")
-    
-    application = Application(
-        layout=Layout(Window(FormattedTextControl(get_formatted_text))),
-        key_bindings=kb,
-        full_screen=True,
-    )
-
-    result = application.run()
+    result = _run_menu(options)
     return result == "Yes, do another search"
@@ -0,0 +1,129 @@
+import gzip
+import struct
+import sys
+from array import array
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+# Compact drop export (.odx): a gzip stream holding a columnar layout of a multi-monster drop dump.
+#
+#   magic "ODRX", version (uint8)
+#   items:    count (uint32), names (strings, see below), ids (int32[count], -1 = not found)
+#   monsters: count (uint32), names (strings)
+#   offsets:  uint32[monsters + 1], start of each monster's run in the drops column
+#   drops:    uint32[offsets[-1]], indexes into the items dictionary, grouped per monster
+#
+# Strings are stored as a UTF-8 blob length (uint32), byte offsets uint32[count + 1] into the blob, and the
+# concatenated UTF-8 blob, so names may contain any character, including newlines.
+# All integers are little-endian. Everything before the drops column is small, so a reader can
+# load the dictionary and offsets and then stream the drops column one monster at a time.
+
+MAGIC = b"ODRX"
+VERSION = 2
+EXPORT_EXTENSION = ".odx"
+
+def _write_uint32(f: BinaryIO, value: int) -> None:
+    f.write(struct.pack("<I", value))
+
+def _read_uint32(f: BinaryIO) -> int:
+    return struct.unpack("<I", _read_exact(f, 4))[0]
+
+def _read_exact(f: BinaryIO, size: int) -> bytes:
+    data = f.read(size)
+    if len(data) != size:
+        raise ValueError("Truncated drop export file")
+    return data
+
+def _write_array(f: BinaryIO, values: array) -> None:
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    f.write(values.tobytes())
+
+def _read_array(f: BinaryIO, typecode: str, count: int) -> array:
+    values = array(typecode)
+    values.frombytes(_read_exact(f, count * values.itemsize))
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+def _write_strings(f: BinaryIO, strings: List[str]) -> None:
+    encoded = [string.encode("utf-8") for string in strings]
+    offsets = array("I", [0])
+    for data in encoded:
+        offsets.append(offsets[-1] + len(data))
+    _write_uint32(f, offsets[-1])
+    _write_array(f, offsets)
+    f.write(b"".join(encoded))
+
+def _read_strings(f: BinaryIO, count: int) -> List[str]:
+    blob_size = _read_uint32(f)
+    offsets = _read_array(f, "I", count + 1)
+    if offsets[0] != 0 or offsets[-1] != blob_size or any(offsets[i] > offsets[i + 1] for i in range(count)):
+        raise ValueError(f"Corrupt drop export file: string offsets do not match {count} strings in {blob_size} bytes")
+    blob = _read_exact(f, blob_size)
+    return [blob[offsets[i]:offsets[i + 1]].decode("utf-8") for i in range(count)]
+
+def save_drop_export(file_path: str, drops_by_monster: Dict[str, List[Tuple[str, Optional[int]]]]) -> str:
+    """Write drop tables for many monsters to a compact, compressed columnar file and return its path."""
+    if not file_path.endswith(EXPORT_EXTENSION):
+        file_path = file_path.rsplit('.', 1)[0] + EXPORT_EXTENSION
+
+    dictionary: Dict[Tuple[str, Optional[int]], int] = {}
+    offsets = array("I", [0])
+    drops_column = array("I")
+    for drops in drops_by_monster.values():
+        for drop in drops:
+            drops_column.append(dictionary.setdefault(drop, len(dictionary)))
+        offsets.append(len(drops_column))
+
+    item_names = [item for item, _ in dictionary]
+    item_ids = array("i", (-1 if item_id is None else item_id for _, item_id in dictionary))
+
+    with gzip.open(file_path, "wb") as f:
+        f.write(MAGIC + bytes([VERSION]))
+        _write_uint32(f, len(item_names))
+        _write_strings(f, item_names)
+        _write_array(f, item_ids)
+        _write_uint32(f, len(drops_by_monster))
+        _write_strings(f, list(drops_by_monster))
+        _write_array(f, offsets)
+        _write_array(f, drops_column)
+    return file_path
+
+def _read_header(f: BinaryIO, file_path: str) -> Tuple[List[Tuple[str, Optional[int]]], List[str], array]:
+    header = _read_exact(f, len(MAGIC) + 1)
+    if header[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"'{file_path}' is not a drop export file")
+    if header[len(MAGIC)] != VERSION:
+        raise ValueError(f"Unsupported drop export version {header[len(MAGIC)]}")
+
+    item_count = _read_uint32(f)
+    item_names = _read_strings(f, item_count)
+    item_ids = _read_array(f, "i", item_count)
+    items = [(name, None if item_id < 0 else item_id) for name, item_id in zip(item_names, item_ids)]
+
+    monster_count = _read_uint32(f)
+    monster_names = _read_strings(f, monster_count)
+    offsets = _read_array(f, "I", monster_count + 1)
+    return items, monster_names, offsets
+
+def iter_drop_export(file_path: str) -> Iterator[Tuple[str, List[Tuple[str, Optional[int]]]]]:
+    """Stream (monster_name, [(item, item_id), ...]) pairs from a compact drop export without loading the whole drops column."""
+    with gzip.open(file_path, "rb") as f:
+        items, monster_names, offsets = _read_header(f, file_path)
+        for i, monster_name in enumerate(monster_names):
+            refs = _read_array(f, "I", offsets[i + 1] - offsets[i])
+            yield monster_name, [items[ref] for ref in refs]
+
+def read_drop_export_columns(file_path: str) -> Tuple[List[Tuple[str, Optional[int]]], List[str], array, array]:
+    """
+    Read a compact drop export as columns: (items, monster_names, offsets, drops).
+    The drops of monster_names[i] are items[ref] for ref in drops[offsets[i]:offsets[i + 1]].
+    """
+    with gzip.open(file_path, "rb") as f:
+        items, monster_names, offsets = _read_header(f, file_path)
+        drops = _read_array(f, "I", offsets[-1])
+    return items, monster_names, offsets, drops
+
+def load_drop_export(file_path: str) -> Dict[str, List[Tuple[str, Optional[int]]]]:
+    return dict(iter_drop_export(file_path))
@@ -4,7 +4,7 @@ import json
 from datetime import datetime
 from typing import List, Tuple, Optional, Set
 
-def save_drops_to_file(category: str, monster_name: str, drops: List[Tuple[str, Optional[int]]], file_path: str, txt_output: bool = False, id_only: bool = False, sort_ids: bool = False, banklayout: bool = False) -> None:
+def save_drops_to_file(category: str, monster_name: str, drops: List[Tuple[str, Optional[int]]], file_path: str, txt_output: bool = False, id_only: bool = False, sort_ids: bool = False, banklayout: bool = False, overwrite_ids: bool = False) -> None:
     # Use monster_name for the file name instead of category
     file_path = file_path.replace(category, monster_name)
     """Save the drop table for a given monster to a single file for the category."""
@@ -40,7 +40,7 @@ def save_drops_to_file(category: str, monster_name: str, drops: List[Tuple[str,
     # Save only item IDs if id_only is True
     if id_only:
         id_file_path = file_path.rsplit('.', 1)[0] + '_ids.txt'
-        with open(id_file_path, "a") as id_file:
+        with open(id_file_path, "w" if overwrite_ids else "a") as id_file:
             unique_ids = set(item_id for _, item_id in drops if item_id is not None)
             if sort_ids:
                 unique_ids = sorted(unique_ids)
@@ -24,16 +24,16 @@ def log_data(category: str, data_type: str, data: Any) -> None:
         else:
             json.dump(data, f, indent=2, ensure_ascii=False)
 
-def log_api_response(category: str, url: str, params: Dict[str, Any], response: Any) -> None:
+def log_api_response(category: str, url: str, params: Dict[str, Any], status_code: int, headers: Any, content: Any) -> None:
     """Log API response data."""
     if not enable_logging:
         return
     log_data(category, "api_response", {
         "url": url,
         "params": params,
-        "status_code": response.status_code,
-        "headers": dict(response.headers),
-        "content": response.text
+        "status_code": status_code,
+        "headers": dict(headers),
+        "content": content.decode('utf-8', 'replace') if isinstance(content, bytes) else content
     })
 
 def log_parsed_data(category: str, data_type: str, data: Any) -> None:
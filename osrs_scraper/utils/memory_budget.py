@@ -0,0 +1,55 @@
+import json
+import tracemalloc
+
+from osrs_scraper.api.wiki_api import extract_monster_page
+
+# Measures the peak memory of one in-flight page on the fetch path with tracemalloc, from reading the raw
+# response body (included) to the finished MonsterPage. The ceilings are enforced by tests/test_memory.py.
+#
+#     python -m osrs_scraper.utils.memory_budget
+
+def build_synthetic_page(tables: int = 12, rows: int = 60, filler_kb: int = 900) -> bytes:
+    """
+    Build a prop=text|revid action=parse response shaped like a large monster page: drop tables and navboxes.
+    The default is about 1 MB of JSON, which is larger than nearly every real monster page.
+    """
+    row = '<tr><td><span class="inventory-image"><img src="/images/Item_{0}.png" width="32" height="32"></span></td><td><a href="/w/Item_{0}" title="Item {0}">Item {0}</a></td><td>1</td><td>Always</td><td>{0}</td></tr>'
+    html = ['<div class="mw-parser-output"><table class="infobox-monster"><tr><td>Monster</td></tr></table>']
+    for table in range(tables):
+        html.append('<table class="wikitable item-drops"><tr><th>Item</th><th>Name</th><th>Quantity</th><th>Rarity</th><th>Price</th></tr>')
+        html.extend(row.format(table * rows + i) for i in range(rows))
+        html.append('</table>')
+    filler = '<div class="navbox"><ul>' + '<li><a href="/w/Page">Some linked page</a></li>' * 20 + '</ul></div>'
+    html.extend(filler for _ in range(filler_kb * 1024 // len(filler)))
+    html.append('</div>')
+    data = {"parse": {"title": "Synthetic monster", "pageid": 1, "revid": 1, "text": {"*": "".join(html)}}}
+    return json.dumps(data).encode("utf-8")
+
+def measure_page_memory(source: bytes) -> tuple:
+    """
+    Return (peak_bytes, retained_bytes) for turning one response into a MonsterPage, following the steps of
+    AsyncWikiClient.fetch_monster_page. The body buffer is allocated inside the measurement, as reading it off
+    the socket would be, so the peak includes the body while it is being decoded.
+    """
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        body = memoryview(source).tobytes()
+        data = json.loads(body)
+        del body
+        page = extract_monster_page("Synthetic monster", data)
+        del data
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    if not page.items:
+        raise RuntimeError("The synthetic page produced no drops")
+    return peak - baseline, current - baseline
+
+if __name__ == "__main__":
+    body = build_synthetic_page()
+    # A first run warms up imports and parser caches, so only per-page memory is measured
+    measure_page_memory(body)
+    peak, retained = measure_page_memory(body)
+    print(f"Page body: {len(body) / 1024:.0f} KiB, peak: {peak / 1024:.0f} KiB, retained: {retained / 1024:.1f} KiB")
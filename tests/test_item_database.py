@@ -0,0 +1,70 @@
+import pytest
+
+from osrs_scraper.data.item_database import ItemIndex
+
+# A small item database with the kinds of names that sit close to each other in the real one.
+# Some items are left out on purpose, so their drop names must stay unresolved instead of matching a neighbour.
+SAMPLE_ITEM_DB = {
+    "536": {"name": "Dragon bones"},
+    "1215": {"name": "Dragon dagger"},
+    "2359": {"name": "Mithril bar"},
+    "989": {"name": "Crystal key"},
+    "5300": {"name": "Snapdragon seed"},
+    "13502": {"name": "Ensouled demon head"},
+    "9194": {"name": "Onyx bolt tips"},
+    "2434": {"name": "Prayer potion(4)"},
+    "139": {"name": "Prayer potion(3)"},
+    "141": {"name": "Prayer potion(2)"},
+    "1712": {"name": "Amulet of glory(4)"},
+    "1704": {"name": "Amulet of glory"},
+    "1333": {"name": "Rune scimitar"},
+    "892": {"name": "Rune arrow"},
+    "28872": {"name": "Rune arrows"},  # Hypothetical item whose variant key clashes with "Rune arrow"
+    "1127": {"name": "Rune platebody"},
+    "2503": {"name": "Black d'hide body"},
+    "995": {"name": "Coins"},
+    "5295": {"name": "Ranarr seed"},
+}
+
+# (name as it appears in a drop table, expected item ID or None when it must stay unresolved)
+EXPECTED_MATCHES = [
+    ("Dragon bones", 536),
+    ("dragon BONES", 536),
+    ("Dragon bone", 536),
+    ("Ranarr seeds", 5295),
+    ("Coins (noted)", 995),
+    ("Rune plate body", 1127),
+    ("Black dhide body", 2503),
+    ("Rune scimatar", 1333),
+    ("Prayer potion (3)", 139),
+    ("Amulet of glory(4)", 1712),
+    ("Mithril bars", 2359),
+    ("Mithril bar (noted)", 2359),
+    ("Crystal keys", 989),
+    ("Dragon daggers", 1215),
+    # Near misses: each of these is a different item from its closest name in the database
+    ("Dragon bolts", None),
+    ("Mithril ore", None),
+    ("Crystal shard", None),
+    ("Dragon dart", None),
+    ("Grimy snapdragon", None),
+    ("Ensouled abyssal head", None),
+    ("Onyx bolts", None),
+    ("Dragon boots", None),
+    ("Prayer potion(1)", None),
+    ("Amulet of glory(6)", None),
+    # Variant keys shared by different items only resolve on an exact name
+    ("Rune arrow", 892),
+    ("Rune arrows", 28872),
+    ("rune  arrow", None),
+    ("Rune-arrows", None),
+    ("Rune arrowz", None),
+]
+
+@pytest.fixture(scope="module")
+def item_index():
+    return ItemIndex(SAMPLE_ITEM_DB)
+
+@pytest.mark.parametrize("name, expected_id", EXPECTED_MATCHES)
+def test_item_name_resolves_to_expected_id(item_index, name, expected_id):
+    assert item_index.get_item_id(name) == expected_id
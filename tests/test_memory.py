@@ -0,0 +1,24 @@
+import pytest
+
+from osrs_scraper.utils.memory_budget import build_synthetic_page, measure_page_memory
+
+# Ceiling for the peak memory of one in-flight ~1 MB page, response body included.
+PEAK_CEILING_BYTES = 4 * 1024 * 1024
+
+# The finished record must not keep any part of the response alive.
+RETAINED_CEILING_BYTES = 256 * 1024
+
+@pytest.fixture(scope="module")
+def page_memory():
+    body = build_synthetic_page()
+    # A first run warms up imports and parser caches, so only per-page memory is measured
+    measure_page_memory(body)
+    return measure_page_memory(body)
+
+def test_peak_memory_per_page_is_under_ceiling(page_memory):
+    peak, _ = page_memory
+    assert peak <= PEAK_CEILING_BYTES, f"peak {peak / 1024:.0f} KiB"
+
+def test_parsed_page_retains_no_response(page_memory):
+    _, retained = page_memory
+    assert retained <= RETAINED_CEILING_BYTES, f"retained {retained / 1024:.1f} KiB"
@@ -0,0 +1,41 @@
+import os
+import re
+import subprocess
+import sys
+
+# Budget for importing the CLI entry point, in microseconds, as reported by `python -X importtime`.
+# This is the cumulative time of the entry point module, so the interpreter's own startup is not counted.
+STARTUP_BUDGET_US = 50_000
+
+# Modules that must never be imported before the interactive UI or a network call actually needs them.
+HEAVY_MODULES = ("rich", "prompt_toolkit", "art", "mwparserfromhell", "aiohttp")
+
+ENTRY_POINT = "osrs_scraper.main"
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s*(\S+)")
+
+def measure_import_time(module):
+    """Import a module in a fresh interpreter and return {module: cumulative_us} from -X importtime."""
+    package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=package_root,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings = {}
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            timings[match.group(3)] = int(match.group(2))
+    return timings
+
+def test_entry_point_does_not_import_heavy_modules():
+    timings = measure_import_time(ENTRY_POINT)
+    assert sorted(name for name in timings if name.split('.')[0] in HEAVY_MODULES) == []
+
+def test_entry_point_imports_within_budget():
+    # The fastest of several runs is compared against the budget to keep noise from failing the test
+    fastest_us = min(measure_import_time(ENTRY_POINT)[ENTRY_POINT] for _ in range(3))
+    assert fastest_us <= STARTUP_BUDGET_US, f"{ENTRY_POINT} import took {fastest_us / 1000:.1f} ms"